@@ -5,13 +5,58 @@ Main pipeline for generating outbound emails to conference attendees.
 import asyncio
 import json
 import os
+from collections import Counter
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+# orjson serializes in Rust, several times faster than the stdlib encoder;
+# fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from utils.scraper import ConferenceScraper
 from utils.llm_processor import LLMProcessor
 from utils.csv_exporter import CSVExporter
+from utils.models import Speaker
+
+# Hoisted to module scope so repeated main() invocations don't re-derive them
+REQUIRED_ENV_VARS = ("CLASSIFICATION_MODEL", "EMAIL_GENERATION_MODEL")
+OUTPUT_DIR = Path(__file__).resolve().parent / "out"
+
+
+async def preload_local_models():
+    """Preload any locally served (Ollama) models before processing starts.
+
+    An empty /api/generate request makes Ollama load the weights into memory
+    and keep_alive=-1 pins them there, so the first real classification does
+    not pay the cold-start model load. Remote API models are unaffected.
+    """
+    local_models = {
+        model.split("/", 1)[1]
+        for model in (os.environ.get(var) for var in REQUIRED_ENV_VARS)
+        if model and model.startswith("ollama/")
+    }
+    if not local_models:
+        return
+
+    import aiohttp
+
+    host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+    try:
+        async with aiohttp.ClientSession() as session:
+            for model in local_models:
+                async with session.post(
+                    f"{host}/api/generate",
+                    json={"model": model, "keep_alive": -1}
+                ) as response:
+                    response.raise_for_status()
+                print(f"🔥 Preloaded local model: {model}")
+    except Exception as e:
+        print(f"⚠️ Could not preload local models ({e}), continuing anyway")
+
 
 async def main():
     """Main pipeline execution."""
@@ -21,13 +66,9 @@ async def main():
     # Load environment variables
     load_dotenv()
 
-    # Verify required environment variables
-    required_env_vars = [
-        "CLASSIFICATION_MODEL",
-        "EMAIL_GENERATION_MODEL"
-    ]
-
-    missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+    # Verify required environment variables (os.environ.get skips the
+    # os.getenv wrapper)
+    missing_vars = [var for var in REQUIRED_ENV_VARS if not os.environ.get(var)]
     if missing_vars:
         print(f"❌ ERROR: Missing required environment variables: {', '.join(missing_vars)}")
         print("Please copy .env_sample to .env and configure your API keys and models.")
@@ -35,59 +76,74 @@ async def main():
 
     print("✅ Environment configuration loaded")
 
+    # Warm up any locally served models so step 2 starts with hot weights
+    await preload_local_models()
+
     # Define file paths
-    output_dir = Path(__file__).parent / "out"
-    output_dir.mkdir(exist_ok=True)
-    raw_speakers_file = output_dir / "raw_speakers.json"
-    email_list_file = output_dir / "email_list.csv"
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    raw_speakers_file = OUTPUT_DIR / "raw_speakers.json"
+    email_list_file = OUTPUT_DIR / "email_list.csv"
 
     # Initialize components
     print("\n📡 Initializing pipeline components...")
     scraper = ConferenceScraper()
+    # LLMProcessor sends the static classification instructions as a system
+    # prompt shared verbatim across every request, so provider prefix caching
+    # only bills/computes the prefill once instead of once per speaker
     llm_processor = LLMProcessor()
     csv_exporter = CSVExporter()
     print("✅ Components initialized")
 
     # STEP 1: Call utils/scraper.py to generate out/raw_speakers.json
     print("\n🌐 STEP 1: Scraping speaker data from Digital Construction Week...")
-    speakers = await scraper.scrape_speakers()
+    async with scraper:
+        speakers = await scraper.scrape_speakers()
 
     if not speakers:
         print("❌ No speakers found. Exiting.")
         return
 
-    # Save raw speaker data to JSON
-    with open(raw_speakers_file, 'w', encoding='utf-8') as f:
-        json.dump(speakers, f, indent=2, ensure_ascii=False)
+    # Save raw speaker data to JSON (compact — the audit copy, not re-read)
+    if orjson is not None:
+        raw_speakers_file.write_bytes(orjson.dumps(speakers))
+    else:
+        with open(raw_speakers_file, 'w', encoding='utf-8') as f:
+            json.dump(speakers, f, ensure_ascii=False)
 
     print(f"✅ Step 1 Complete: {len(speakers)} speakers saved to {raw_speakers_file}")
 
-    # STEP 2: Call utils/llm_processor.py to process speakers from JSON file
+    # STEP 2+3: Stream LLM results straight into out/email_list.csv.
+    # Rows are written (and the summary tallied) as each speaker completes,
+    # overlapping inference latency with disk I/O instead of holding the CSV
+    # until the last LLM call returns.
     print(f"\n🤖 STEP 2: Processing speakers with LLM classification and email generation...")
-    processed_speakers = await llm_processor.process_speakers_from_file(str(raw_speakers_file))
+    print(f"📄 Streaming results into {email_list_file}...")
 
-    print("✅ Step 2 Complete: LLM processing finished")
-
-    # Show classification summary
-    categories = {}
+    speaker_models = [Speaker(**s) for s in speakers]
+    processed_speakers = []
+    categories = Counter()
     emails_generated = 0
-    for speaker in processed_speakers:
-        category = speaker.category.value
-        categories[category] = categories.get(category, 0) + 1
-        if speaker.email_subject:  # Email was generated
-            emails_generated += 1
+
+    with csv_exporter.open_csv(str(email_list_file)) as write_row:
+        async for speaker in llm_processor.astream_processed(speaker_models):
+            write_row(speaker)
+            processed_speakers.append(speaker)
+            categories[speaker.category.value] += 1
+            if speaker.email_subject:  # Email was generated
+                emails_generated += 1
+
+    llm_processor.save_processed(
+        processed_speakers,
+        str(OUTPUT_DIR / "speakers_with_categories.json")
+    )
+
+    print("✅ Steps 2+3 Complete: LLM processing finished, final CSV exported")
 
     print(f"\n📊 Classification Summary:")
     for category, count in sorted(categories.items()):
         print(f"   {category}: {count}")
     print(f"   Emails generated: {emails_generated}")
 
-    # STEP 3: Call utils/csv_exporter.py to generate out/email_list.csv
-    print(f"\n📄 STEP 3: Generating final CSV output...")
-    csv_exporter.export_to_csv(processed_speakers, str(email_list_file))
-
-    print("✅ Step 3 Complete: Final CSV exported")
-
     # Step 4: Display sample results
     print(f"\n📧 Sample Email Results:")
     print("-" * 40)
@@ -104,4 +160,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop (libuv-based event loop) speeds up the network-IO heavy
+    # scraping and LLM steps; unavailable on Windows, so fall back quietly
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
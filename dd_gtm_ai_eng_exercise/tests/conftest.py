@@ -3,6 +3,8 @@ import pytest
 import json
 from pathlib import Path
 
+from utils.models import ProcessedSpeaker, Category, CompanySize
+
 
 @pytest.fixture
 def sample_speakers():
@@ -46,8 +48,6 @@ def temp_output_dir(tmp_path):
 @pytest.fixture
 def sample_processed_speakers():
     """Sample processed speaker data with classifications."""
-    from utils.models import ProcessedSpeaker, Category, CompanySize
-
     return [
         ProcessedSpeaker(
             name="John Smith",
@@ -3,6 +3,7 @@ import csv
 import pytest
 from pathlib import Path
 from utils.csv_exporter import CSVExporter
+from utils.models import ProcessedSpeaker, Category, CompanySize
 
 
 class TestCSVExporter:
@@ -79,7 +80,6 @@ class TestCSVExporter:
         output_file = tmp_path / "new_dir" / "output.csv"
 
         # Create minimal valid speaker for testing
-        from utils.models import ProcessedSpeaker, Category, CompanySize
         speaker = ProcessedSpeaker(
             name="Test",
             title="Manager",
@@ -97,8 +97,6 @@ class TestCSVExporter:
 
     def test_export_utf8_encoding(self, temp_output_dir):
         """Test that CSV handles UTF-8 characters correctly."""
-        from utils.models import ProcessedSpeaker, Category, CompanySize
-
         # Create speaker with special characters
         speaker = ProcessedSpeaker(
             name="José García",
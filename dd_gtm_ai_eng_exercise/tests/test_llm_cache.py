@@ -0,0 +1,96 @@
+"""Tests for the LLM response cache backends."""
+import json
+import time
+
+import pytest
+
+from utils.llm_cache import DiskCache, MemoryCache, request_key
+
+
+class TestRequestKey:
+    """Test the content-hash request key."""
+
+    def test_key_is_deterministic(self):
+        """Test that identical requests produce identical keys."""
+        messages = [{"role": "user", "content": "classify me"}]
+        assert request_key("gpt-4o-mini", messages) == request_key("gpt-4o-mini", messages)
+
+    def test_key_varies_with_request_contents(self):
+        """Test that model, messages, and temperature all affect the key."""
+        messages = [{"role": "user", "content": "classify me"}]
+        keys = {
+            request_key("gpt-4o-mini", messages),
+            request_key("gpt-3.5-turbo", messages),
+            request_key("gpt-4o-mini", [{"role": "user", "content": "other"}]),
+            request_key("gpt-4o-mini", messages, temperature=0.5),
+        }
+        assert len(keys) == 4
+
+
+class TestMemoryCache:
+    """Test the in-process cache backend."""
+
+    async def test_miss_returns_none_and_counts(self):
+        """Test that a missing key is a miss."""
+        cache = MemoryCache()
+        assert await cache.get("missing") is None
+        assert cache.misses == 1
+        assert cache.hits == 0
+
+    async def test_set_then_get(self):
+        """Test that stored values round-trip."""
+        cache = MemoryCache()
+        await cache.set("key", {"value": 1})
+        assert await cache.get("key") == {"value": 1}
+        assert cache.hits == 1
+
+    async def test_expired_entry_is_a_miss(self, mocker):
+        """Test that entries past their TTL are not served."""
+        cache = MemoryCache()
+        await cache.set("key", {"value": 1}, ttl=10)
+        assert await cache.get("key") == {"value": 1}
+
+        mocker.patch("utils.llm_cache.time.time", return_value=time.time() + 11)
+        assert await cache.get("key") is None
+
+    async def test_entry_without_ttl_never_expires(self, mocker):
+        """Test that ttl-less entries survive arbitrary clock advances."""
+        cache = MemoryCache()
+        await cache.set("key", {"value": 1})
+
+        mocker.patch("utils.llm_cache.time.time", return_value=time.time() + 10**9)
+        assert await cache.get("key") == {"value": 1}
+
+
+class TestDiskCache:
+    """Test the JSON-file cache backend."""
+
+    async def test_flush_persists_across_instances(self, tmp_path):
+        """Test that flushed entries survive a fresh load."""
+        cache = DiskCache(cache_dir=tmp_path)
+        await cache.set("key", {"value": 1}, ttl=60)
+        cache.flush()
+
+        reloaded = DiskCache(cache_dir=tmp_path)
+        assert await reloaded.get("key") == {"value": 1}
+
+    async def test_flush_prunes_expired_entries(self, tmp_path, mocker):
+        """Test that expired entries are dropped from the file on flush."""
+        cache = DiskCache(cache_dir=tmp_path)
+        await cache.set("stale", {"value": 1}, ttl=10)
+        await cache.set("live", {"value": 2}, ttl=3600)
+        await cache.set("forever", {"value": 3})
+
+        mocker.patch("utils.llm_cache.time.time", return_value=time.time() + 60)
+        cache.flush()
+
+        with open(tmp_path / "llm_responses.json", encoding='utf-8') as f:
+            stored = json.load(f)
+        assert set(stored) == {"live", "forever"}
+
+    def test_missing_or_corrupt_file_starts_empty(self, tmp_path):
+        """Test that a bad cache file degrades to an empty cache."""
+        assert DiskCache(cache_dir=tmp_path)._store == {}
+
+        (tmp_path / "llm_responses.json").write_text("not json")
+        assert DiskCache(cache_dir=tmp_path)._store == {}
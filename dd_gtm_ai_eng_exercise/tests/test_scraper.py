@@ -1,7 +1,12 @@
 """Tests for web scraper."""
+import aiohttp
 import pytest
+from aioresponses import aioresponses
+
 from utils.scraper import ConferenceScraper
 
+SPEAKERS_URL = "https://www.digitalconstructionweek.com/all-speakers/"
+
 
 class TestConferenceScraper:
     """Test ConferenceScraper class."""
@@ -27,6 +32,17 @@ class TestConferenceScraper:
         assert title == "Site Manager"
         assert company == "BuildCo"
 
+    def test_parse_job_text_separator_priority(self):
+        """Test that ' at ' takes priority over earlier ','/'-' separators."""
+        scraper = ConferenceScraper()
+        title, company = scraper._parse_job_text("VP, Engineering at Acme Corp")
+        assert title == "VP, Engineering"
+        assert company == "Acme Corp"
+
+        title, company = scraper._parse_job_text("Director - Digital at Acme Corp")
+        assert title == "Director - Digital"
+        assert company == "Acme Corp"
+
     def test_parse_job_text_no_separator(self):
         """Test parsing job text with no separator (all title)."""
         scraper = ConferenceScraper()
@@ -91,4 +107,81 @@ class TestConferenceScraper:
         scraper = ConferenceScraper()
         speakers = scraper._parse_speakers("<html><div><h3>Bad HTML</h3>")
         # Should not crash, just return empty or partial results
-        assert isinstance(speakers, list)
\ No newline at end of file
+        assert isinstance(speakers, list)
+
+
+class TestFetchRetry:
+    """Test _fetch retry/backoff behavior."""
+
+    @pytest.fixture
+    def no_sleep(self, mocker):
+        """Skip real backoff sleeps, recording the requested delays."""
+        return mocker.patch("utils.scraper.asyncio.sleep")
+
+    async def test_fetch_success_returns_body(self, no_sleep):
+        """Test that a 200 response returns the decoded body."""
+        scraper = ConferenceScraper()
+        with aioresponses() as mocked:
+            mocked.get(SPEAKERS_URL, status=200, body="<html>ok</html>")
+            html = await scraper._fetch(SPEAKERS_URL)
+        await scraper.aclose()
+
+        assert html == "<html>ok</html>"
+        no_sleep.assert_not_awaited()
+
+    async def test_fetch_retries_429_honoring_retry_after(self, no_sleep):
+        """Test that a 429 is retried after the server-provided delay."""
+        scraper = ConferenceScraper()
+        with aioresponses() as mocked:
+            mocked.get(SPEAKERS_URL, status=429, headers={"Retry-After": "7"})
+            mocked.get(SPEAKERS_URL, status=200, body="<html>ok</html>")
+            html = await scraper._fetch(SPEAKERS_URL)
+        await scraper.aclose()
+
+        assert html == "<html>ok</html>"
+        no_sleep.assert_awaited_once_with(7)
+
+    async def test_fetch_retries_server_error_then_succeeds(self, no_sleep):
+        """Test that a 5xx response is retried with backoff."""
+        scraper = ConferenceScraper()
+        with aioresponses() as mocked:
+            mocked.get(SPEAKERS_URL, status=503)
+            mocked.get(SPEAKERS_URL, status=200, body="<html>ok</html>")
+            html = await scraper._fetch(SPEAKERS_URL)
+        await scraper.aclose()
+
+        assert html == "<html>ok</html>"
+        assert no_sleep.await_count == 1
+
+    async def test_fetch_404_returns_empty_without_retry(self, no_sleep):
+        """Test that non-retryable client errors short-circuit."""
+        scraper = ConferenceScraper()
+        with aioresponses() as mocked:
+            mocked.get(SPEAKERS_URL, status=404)
+            html = await scraper._fetch(SPEAKERS_URL)
+        await scraper.aclose()
+
+        assert html == ''
+        no_sleep.assert_not_awaited()
+
+    async def test_fetch_gives_up_after_max_attempts(self, no_sleep):
+        """Test that persistent 5xx failures yield an empty result."""
+        scraper = ConferenceScraper()
+        with aioresponses() as mocked:
+            for _ in range(3):
+                mocked.get(SPEAKERS_URL, status=500)
+            html = await scraper._fetch(SPEAKERS_URL, max_attempts=3)
+        await scraper.aclose()
+
+        assert html == ''
+        assert no_sleep.await_count == 2  # no sleep after the final attempt
+
+    async def test_fetch_raises_on_persistent_connection_errors(self, no_sleep):
+        """Test that connection errors propagate once attempts are exhausted."""
+        scraper = ConferenceScraper()
+        with aioresponses() as mocked:
+            mocked.get(SPEAKERS_URL, exception=aiohttp.ClientConnectionError())
+            mocked.get(SPEAKERS_URL, exception=aiohttp.ClientConnectionError())
+            with pytest.raises(aiohttp.ClientError):
+                await scraper._fetch(SPEAKERS_URL, max_attempts=2)
+        await scraper.aclose()
\ No newline at end of file
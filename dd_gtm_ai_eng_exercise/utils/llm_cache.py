@@ -0,0 +1,97 @@
+"""
+Exact-match response cache for LLM chat completions.
+
+Classification is effectively deterministic (fixed prompt, no temperature),
+so identical requests can be answered from cache instead of paying the full
+network round-trip and token spend on every run.
+"""
+import json
+import hashlib
+import time
+from pathlib import Path
+from typing import Optional, Protocol
+
+# Default on-disk location, shared across working copies
+DEFAULT_CACHE_DIR = Path.home() / ".dd_gtm_ai" / "cache"
+
+
+def request_key(model: str, messages: list, temperature: Optional[float] = None) -> str:
+    """Content hash identifying a chat completion request.
+
+    Any change to the model, the prompt text, or the sampling temperature
+    produces a different key, so stale entries are never served.
+    """
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Interface for LLM response cache backends."""
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Return the cached value for key, or None on miss/expiry."""
+        ...
+
+    async def set(self, key: str, value: dict, ttl: Optional[float] = None) -> None:
+        """Store value under key, expiring after ttl seconds if given."""
+        ...
+
+    def flush(self) -> None:
+        """Persist any pending writes (no-op for volatile backends)."""
+        ...
+
+
+class MemoryCache:
+    """In-process cache backend; contents die with the interpreter."""
+
+    def __init__(self):
+        self._store = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[dict]:
+        entry = self._store.get(key)
+        if entry is None or (entry["expires_at"] is not None and entry["expires_at"] < time.time()):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["value"]
+
+    async def set(self, key: str, value: dict, ttl: Optional[float] = None) -> None:
+        self._store[key] = {
+            "value": value,
+            "expires_at": time.time() + ttl if ttl else None
+        }
+
+    def flush(self) -> None:
+        pass
+
+
+class DiskCache(MemoryCache):
+    """JSON-file cache backend persisted under ~/.dd_gtm_ai/cache/.
+
+    Entries are kept in memory and written out via flush() so bulk runs
+    don't rewrite the file once per request.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        super().__init__()
+        self._cache_file = Path(cache_dir or DEFAULT_CACHE_DIR) / "llm_responses.json"
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                self._store = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._store = {}
+
+    def flush(self) -> None:
+        now = time.time()
+        self._store = {
+            key: entry for key, entry in self._store.items()
+            if entry["expires_at"] is None or entry["expires_at"] >= now
+        }
+        self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self._store, f, ensure_ascii=False)
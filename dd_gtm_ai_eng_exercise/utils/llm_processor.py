@@ -3,15 +3,25 @@ LLM processor for company classification and email generation.
 Reads from out/raw_speakers.json and processes speakers.
 """
 import os
+import re
 import json
 import random
 import asyncio
+import hashlib
+import functools
 import logging
 from collections import Counter
-from typing import List, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from pathlib import Path
 
-from openai import AsyncOpenAI, RateLimitError
+from aiolimiter import AsyncLimiter
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
+
+# orjson parses/serializes in Rust; fall back to json when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 from pydantic import ValidationError
 from tenacity import (
     retry,
@@ -20,25 +30,99 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from utils.llm_cache import DiskCache, request_key
 from utils.models import (
     Category,
     CompanySize,
     Speaker,
+    ClassificationBatch,
     ClassificationResult,
     EmailContent,
     ProcessedSpeaker
 )
 
+# Repo root (templates live in in/, artifacts in out/)
+BASE_DIR = Path(__file__).parent.parent
+
+# Cached LLM responses expire after a week; conference rosters are stable on
+# that horizon but classifications shouldn't outlive them forever
+RESPONSE_CACHE_TTL = 86400 * 7
+
+# Per-speaker input sent as the user message. All static instructions live in
+# the system prompt (in/prompt_template.txt) so every request shares an
+# identical prefix and benefits from provider-side prompt caching.
+SPEAKER_INPUT_TEMPLATE = (
+    "Company: {company_name}\n"
+    "Speaker: {speaker_name}\n"
+    "Title: {speaker_title}"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_competitor_cached(competitor_re: "re.Pattern[str]", company: str) -> bool:
+    """Memoized competitor scan.
+
+    Module-level (with the compiled pattern as part of the key) rather than a
+    cached bound method, so the cache never pins an LLMProcessor instance.
+    Duplicate companies — common across speakers and repeat batches — skip
+    the regex scan entirely.
+    """
+    return competitor_re.search(company) is not None
+
+
+# '{field}' placeholders in prompt/email templates
+_TEMPLATE_FIELD_RE = re.compile(r"\{(\w+)\}")
+
+
+def _compile_template(template: str):
+    """Compile a '{field}' template into a render callable.
+
+    str.format re-parses the template string on every call; pre-splitting
+    into literal/field segments once turns each render into a simple join.
+    """
+    parts = _TEMPLATE_FIELD_RE.split(template)
+    literals = parts[0::2]
+    fields = parts[1::2]
+
+    def render(**kwargs) -> str:
+        chunks = [literals[0]]
+        for field, literal in zip(fields, literals[1:]):
+            chunks.append(kwargs[field])
+            chunks.append(literal)
+        return "".join(chunks)
+
+    return render
+
+
+_render_speaker_input = _compile_template(SPEAKER_INPUT_TEMPLATE)
+
+# Header prepended to the user message of a batched classification request
+BATCH_INPUT_HEADER = (
+    "Classify each of the following speakers. Respond with JSON matching the "
+    "provided schema: one entry per speaker, echoing that speaker's idx."
+)
+
 
 class LLMProcessor:
     def __init__(self):
         """Initialize LLM processor with environment configuration."""
         self.classification_model = os.getenv("CLASSIFICATION_MODEL")
         self.email_generation_model = os.getenv("EMAIL_GENERATION_MODEL")
-        self.max_concurrent = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
-        self.request_delay = float(os.getenv("REQUEST_DELAY_SECONDS", "0.5"))
+        self.batch_size = int(os.getenv("BATCH_SIZE", "16"))
+        # Speakers packed into one structured-output classification request;
+        # 1 disables batching (e.g. for providers without json_schema support)
+        self.classify_batch_size = int(os.getenv("CLASSIFY_BATCH_SIZE", "15"))
+        # MAX_CONCURRENCY is preferred; MAX_CONCURRENT_REQUESTS kept for backwards compatibility
+        self.max_concurrent = int(
+            os.getenv("MAX_CONCURRENCY", os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
+        )
+        self.requests_per_minute = int(os.getenv("REQUESTS_PER_MINUTE", "120"))
         self.debug = os.getenv("DEBUG", "false").lower() == "true"
 
+        # Per-instance RNG for subject selection: avoids the global random
+        # module's shared state and makes runs reproducible via EMAIL_SEED
+        self._rng = random.Random(int(os.getenv("EMAIL_SEED", "0")) or None)
+
         if not self.classification_model or not self.email_generation_model:
             raise ValueError("CLASSIFICATION_MODEL and EMAIL_GENERATION_MODEL must be set in .env")
 
@@ -50,47 +134,111 @@ class LLMProcessor:
         if self.debug:
             logging.basicConfig(level=logging.DEBUG)
 
-        # Load templates
-        self._load_templates()
-
-        # Semaphore for rate limiting
+        # Semaphore bounds in-flight requests (memory/connections); the
+        # token-bucket limiter paces actual submissions so concurrency and
+        # request rate are controlled independently and requests don't burst
+        # into 429s when the semaphore opens
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
-
-    def _load_templates(self):
-        """Load prompt and email templates from in/ directory."""
-        base_dir = Path(__file__).parent.parent
-
-        # Load prompt template
-        prompt_path = base_dir / "in" / "prompt_template.txt"
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            self.prompt_template = f.read()
-
-        # Load email templates
-        email_path = base_dir / "in" / "email_templates.json"
-        with open(email_path, 'r', encoding='utf-8') as f:
-            self.email_templates = json.load(f)
-
-        # Known competitors list for pre-validation
-        self.known_competitors = [
-            'autodesk', 'bentley', 'trimble', 'plangrid', 'procore',
-            'pix4d', 'skycatch', 'droneseed', 'kespry', 'measure',
-            'site 1001', 'propeller aero', 'propeller'
-        ]
+        self._rate_limiter = AsyncLimiter(self.requests_per_minute, 60)
+
+        # On-disk memoization of classification results keyed by
+        # (company, title) — conferences list many speakers from the same
+        # company, and repeated runs re-classify the same cohort
+        self._cache_file = BASE_DIR / "out" / "classify_cache.json"
+        self._classification_cache = self._load_classification_cache()
+
+        # Second tier: exact-match response cache keyed on the full request
+        # (model + messages), shared across working copies under ~/.dd_gtm_ai/
+        self.response_cache = DiskCache()
+
+        # In-flight classification tasks keyed by normalized company, so
+        # concurrent speakers from the same company share one LLM request
+        self._company_classifications = {}
+
+    # Known competitors list for pre-validation
+    known_competitors = [
+        'autodesk', 'bentley', 'trimble', 'plangrid', 'procore',
+        'pix4d', 'skycatch', 'droneseed', 'kespry', 'measure',
+        'site 1001', 'propeller aero', 'propeller'
+    ]
+
+    # Templates and the competitor matcher are loaded lazily on first use, so
+    # constructing a processor (tests, CLI introspection) costs no disk I/O
+
+    @functools.cached_property
+    def prompt_template(self) -> str:
+        """Static classification system prompt from in/prompt_template.txt."""
+        return (BASE_DIR / "in" / "prompt_template.txt").read_text(encoding='utf-8')
+
+    @functools.cached_property
+    def email_templates(self) -> dict:
+        """Email templates, pre-compiled so per-speaker rendering skips
+        str.format's template re-parse."""
+        raw = (BASE_DIR / "in" / "email_templates.json").read_bytes()
+        templates_by_category = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        for templates in templates_by_category.values():
+            templates["subject_compiled"] = [
+                _compile_template(t) for t in templates["subject_templates"]
+            ]
+            templates["body_compiled"] = _compile_template(templates["body_template"])
+        return templates_by_category
+
+    @functools.cached_property
+    def _competitor_re(self) -> "re.Pattern[str]":
+        """Single alternation over the competitor names: one C-level scan
+        per company instead of one substring pass per competitor."""
+        return re.compile(
+            "|".join(re.escape(c) for c in self.known_competitors),
+            re.IGNORECASE
+        )
+
+    def _load_classification_cache(self) -> Dict[str, dict]:
+        """Load the persisted classification cache, if present."""
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_classification_cache(self) -> None:
+        """Persist the classification cache to out/classify_cache.json."""
+        self._cache_file.parent.mkdir(exist_ok=True)
+        with open(self._cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self._classification_cache, f, ensure_ascii=False)
+
+    @functools.cached_property
+    def _prompt_version(self) -> str:
+        """Digest of the prompt template, computed once per process."""
+        return hashlib.blake2b(
+            self.prompt_template.encode(), digest_size=8
+        ).hexdigest()
+
+    def _classification_cache_key(self, speaker: Speaker) -> str:
+        """Cache key for a speaker's classification.
+
+        Includes the model name and a prompt digest so cached entries are
+        invalidated when either changes.
+        """
+        key = (
+            f"{self.classification_model}|{self._prompt_version}|"
+            f"{speaker.company.lower().strip()}|{speaker.title.lower().strip()}"
+        )
+        return hashlib.blake2b(key.encode()).hexdigest()
 
     def _is_known_competitor(self, company_name: str) -> bool:
         """Check if company is a known competitor before LLM classification."""
-        company_lower = company_name.lower()
-        for competitor in self.known_competitors:
-            if competitor in company_lower:
-                return True
-        return False
+        return _is_competitor_cached(self._competitor_re, company_name)
 
-    def _extract_field_value(self, line: str, prefix: str) -> str:
-        """Extract value from 'Prefix: value' or 'Prefix: [value|other]' format."""
-        text = line.removeprefix(f"{prefix}:").strip()
+    # Field labels expected in the classification response; startswith takes
+    # the tuple directly so each line is screened with one C call
+    _FIELD_PREFIXES = ("Category:", "Company Size:", "Reasoning:")
+
+    def _extract_field_value(self, text: str) -> str:
+        """Extract value from 'value' or '[value|other]' format."""
+        text = text.strip()
 
         if text.startswith('[') and ']' in text:
-            return text[1:text.index(']')].split('|')[0]
+            return text[1:text.index(']')].partition('|')[0]
         return text
 
     async def classify_speaker(self, speaker: Speaker) -> ClassificationResult:
@@ -98,12 +246,29 @@ class LLMProcessor:
         Classify a speaker into Builder/Owner/Partner/Competitor/Other category
         and determine company size using web search.
 
+        Classification is company-level, so concurrent speakers from the same
+        company coalesce onto a single in-flight LLM request instead of each
+        issuing their own.
+
         Args:
             speaker: Speaker object with name, title, and company
 
         Returns:
             ClassificationResult with category, reasoning, and company_size
         """
+        company_key = speaker.company.strip().lower()
+        if not company_key:
+            # No company to coalesce on — classify individually
+            return await self._classify_company(speaker)
+
+        task = self._company_classifications.get(company_key)
+        if task is None:
+            task = asyncio.ensure_future(self._classify_company(speaker))
+            self._company_classifications[company_key] = task
+        return await task
+
+    async def _classify_company(self, speaker: Speaker) -> ClassificationResult:
+        """Resolve one company's classification (fast paths, cache, then LLM)."""
         # Pre-validation: Check if company is a known competitor
         if self._is_known_competitor(speaker.company):
             if self.debug:
@@ -114,8 +279,18 @@ class LLMProcessor:
                 reasoning=f"Known competitor in drone/construction software space"
             )
 
+        # Check the on-disk cache before dispatching an LLM request
+        cache_key = self._classification_cache_key(speaker)
+        cached = self._classification_cache.get(cache_key)
+        if cached is not None:
+            if self.debug:
+                print(f"💾 Cache hit for {speaker.company} / {speaker.title}")
+            return ClassificationResult(**cached)
+
         try:
-            return await self._classify_speaker_with_retry(speaker)
+            result = await self._classify_speaker_with_retry(speaker)
+            self._classification_cache[cache_key] = result.model_dump(mode='json')
+            return result
         except RateLimitError as e:
             # Always exit on rate limit errors regardless of DEBUG mode
             print(f"❌ Rate limit exceeded: {str(e)}")
@@ -134,66 +309,189 @@ class LLMProcessor:
                     reasoning=f"Classification failed: {str(e)}"
                 )
 
+    async def classify_speakers_chunk(self, speakers: List[Speaker]) -> List[Optional[ClassificationResult]]:
+        """
+        Classify several speakers in a single structured-output request.
+
+        Packing speakers into one call amortizes the shared system prompt and
+        replaces N HTTP round-trips (and rate-limit charges) with one.
+
+        Returns one result per input speaker, with None where the model
+        omitted an entry or the batched call failed entirely — callers fall
+        back to per-speaker classification for those.
+        """
+        speaker_lines = "\n".join(
+            f"idx {i}: Company: {s.company} | Speaker: {s.name} | Title: {s.title}"
+            for i, s in enumerate(speakers)
+        )
+        messages = [
+            {"role": "system", "content": self.prompt_template},
+            {"role": "user", "content": f"{BATCH_INPUT_HEADER}\n{speaker_lines}"}
+        ]
+
+        try:
+            async with self._semaphore:
+                async with self._rate_limiter:
+                    response = await self.client.chat.completions.create(
+                        model=self.classification_model,
+                        messages=messages,
+                        response_format={
+                            "type": "json_schema",
+                            "json_schema": {
+                                "name": "classifications",
+                                "schema": ClassificationBatch.model_json_schema(),
+                                "strict": True
+                            }
+                        },
+                        extra_body={"prompt_cache_key": "dd-gtm-classification"},
+                    )
+            batch = ClassificationBatch.model_validate_json(
+                response.choices[0].message.content
+            )
+        except Exception as e:
+            print(f"⚠️ Batched classification failed, falling back to per-speaker calls: {e}")
+            return [None] * len(speakers)
+
+        results: List[Optional[ClassificationResult]] = [None] * len(speakers)
+        for item in batch.classifications:
+            if item.idx < len(speakers):
+                results[item.idx] = ClassificationResult(
+                    category=item.category,
+                    company_size=item.company_size,
+                    reasoning=item.reasoning
+                )
+        return results
+
+    async def _prefetch_classifications(self, speakers: List[Speaker]) -> None:
+        """
+        Resolve a batch's unclassified unique companies in grouped
+        structured-output requests, seeding the per-company task map.
+
+        Companies already covered by the competitor fast path, the on-disk
+        cache, or an in-flight task are skipped; failures simply leave the
+        company to the per-speaker fallback in classify_speaker.
+        """
+        if self.classify_batch_size <= 1:
+            return
+
+        pending: List[Speaker] = []
+        for speaker in speakers:
+            company_key = speaker.company.strip().lower()
+            if not company_key or company_key in self._company_classifications:
+                continue
+            if self._is_known_competitor(speaker.company):
+                continue
+            if self._classification_cache_key(speaker) in self._classification_cache:
+                continue
+            if any(s.company.strip().lower() == company_key for s in pending):
+                continue
+            pending.append(speaker)
+
+        if len(pending) < 2:
+            return
+
+        for start in range(0, len(pending), self.classify_batch_size):
+            chunk = pending[start:start + self.classify_batch_size]
+            results = await self.classify_speakers_chunk(chunk)
+            for speaker, result in zip(chunk, results):
+                if result is None:
+                    continue
+                self._classification_cache[self._classification_cache_key(speaker)] = \
+                    result.model_dump(mode='json')
+                future = asyncio.get_running_loop().create_future()
+                future.set_result(result)
+                self._company_classifications[speaker.company.strip().lower()] = future
+
+    async def _classify_speaker_with_retry(self, speaker: Speaker) -> ClassificationResult:
+        """Internal method with retry logic for speaker classification."""
+        # Static system prompt first, speaker-specific content in the user
+        # message, so the shared prefix is cacheable across all speakers
+        speaker_input = _render_speaker_input(
+            company_name=speaker.company,
+            speaker_name=speaker.name,
+            speaker_title=speaker.title
+        )
+        messages = [
+            {"role": "system", "content": self.prompt_template},
+            {"role": "user", "content": speaker_input}
+        ]
+
+        # Exact-match response cache: hits bypass the semaphore, rate
+        # limiter, and retry machinery entirely
+        response_key = request_key(self.classification_model, messages)
+        cached_response = await self.response_cache.get(response_key)
+        if cached_response is not None:
+            content = (cached_response["choices"][0]["message"]["content"] or "").strip()
+            return self._parse_and_validate_classification(content)
+
+        response = await self._request_classification(messages)
+        content = (response.choices[0].message.content or "").strip()
+
+        # Validation runs outside the retry loop: a malformed response is
+        # deterministic, so retrying it would only burn backoff time. Only
+        # responses that parse cleanly are cached — a bad response shouldn't
+        # be re-served for the next week
+        result = self._parse_and_validate_classification(content)
+        await self.response_cache.set(
+            response_key, response.model_dump(mode='json'), ttl=RESPONSE_CACHE_TTL
+        )
+        return result
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=2, min=4, max=60),  # 4s, 8s, 16s, 32s, 60s
-        retry=retry_if_exception_type((Exception,)),  # Retry all exceptions including rate limits
+        # Retry only transient network/rate-limit failures; programmer errors
+        # and validation failures surface immediately
+        retry=retry_if_exception_type((
+            RateLimitError,
+            APIConnectionError,
+            APITimeoutError,
+            asyncio.TimeoutError,
+        )),
         before_sleep=lambda retry_state: (
-            print(f"⏳ Retry {retry_state.attempt_number} after {retry_state.outcome.exception().__class__.__name__}: waiting {retry_state.next_action.sleep} seconds...")
-            if retry_state.outcome.failed else None
+            print(f"⏳ Retry {retry_state.attempt_number} after {retry_state.outcome.exception().__class__.__name__}: waiting {retry_state.next_action.sleep} seconds...")  # type: ignore[union-attr]
+            if retry_state.outcome and retry_state.outcome.failed else None
         ),
         reraise=True
     )
-    async def _classify_speaker_with_retry(self, speaker: Speaker) -> ClassificationResult:
-        """Internal method with retry logic for speaker classification."""
+    async def _request_classification(self, messages: List[dict]):
+        """Issue one classification request, returning the raw response."""
         async with self._semaphore:
-            # Add delay for rate limiting
-            await asyncio.sleep(self.request_delay)
-
-            # Format the prompt
-            prompt = self.prompt_template.format(
-                company_name=speaker.company,
-                speaker_name=speaker.name,
-                speaker_title=speaker.title
-            )
-
-            response = await self.client.chat.completions.create(
-                model=self.classification_model,
-                messages=[{"role": "user", "content": prompt}],
-                # temperature not supported by gpt-4o-search-preview
-                # web_search_options={}  # Enable web search
-            )
-
-            content = response.choices[0].message.content.strip()
-
-            # Validate output with Pydantic
-            return self._parse_and_validate_classification(content)
+            async with self._rate_limiter:
+                return await self.client.chat.completions.create(
+                    model=self.classification_model,
+                    messages=messages,
+                    # temperature not supported by gpt-4o-search-preview
+                    # web_search_options={}  # Enable web search
+                    # Route all classification requests to the same cache shard
+                    extra_body={"prompt_cache_key": "dd-gtm-classification"},
+                )
 
     def _parse_classification_response(self, content: str) -> Tuple[str, str, str]:
-        """Parse LLM classification response."""
-        category = "Other"
-        reasoning = "Unable to parse response"
-        company_size = "Unknown"
-
-        for line in content.split('\n'):
+        """Parse LLM classification response in a single pass."""
+        fields = {
+            "Category": "Other",
+            "Company Size": "Unknown",
+            "Reasoning": "Unable to parse response"
+        }
+
+        for line in content.splitlines():
             line = line.strip()
-            if line.startswith("Category:"):
-                category = self._extract_field_value(line, "Category")
-            elif line.startswith("Company Size:"):
-                company_size = self._extract_field_value(line, "Company Size")
-            elif line.startswith("Reasoning:"):
-                reasoning = self._extract_field_value(line, "Reasoning")
+            if line.startswith(self._FIELD_PREFIXES):
+                key, _, rest = line.partition(':')
+                fields[key] = self._extract_field_value(rest)
 
-        return category, reasoning, company_size
+        return fields["Category"], fields["Reasoning"], fields["Company Size"]
 
     def _parse_and_validate_classification(self, content: str) -> ClassificationResult:
         """Parse and validate LLM classification response using Pydantic."""
         category, reasoning, company_size = self._parse_classification_response(content)
 
         try:
+            # Pydantic coerces the parsed strings into the enum fields
             return ClassificationResult(
-                category=category,
-                company_size=company_size,
+                category=category,  # type: ignore[arg-type]
+                company_size=company_size,  # type: ignore[arg-type]
                 reasoning=reasoning
             )
         except ValidationError:
@@ -201,44 +499,140 @@ class LLMProcessor:
                 self.logger.debug(f"Validation failed: {content[:200]}...")
             raise
 
-    async def generate_email(self, speaker: Speaker, category: Category, company_size: CompanySize) -> EmailContent:
+    def generate_email(self, speaker: Speaker, category: Category, company_size: CompanySize) -> EmailContent:
         """
         Generate email subject and body for Builder/Owner categories with Large company size.
 
+        Pure template rendering — no LLM call — so it runs synchronously and
+        never touches the request semaphore or rate limiter.
+
         Returns:
             EmailContent with subject and body, or empty strings for non-target categories
         """
         # Only generate emails for Builder and Owner categories with Large company size
         if category not in [Category.BUILDER, Category.OWNER] or company_size != CompanySize.LARGE:
-            return EmailContent(subject="", body="")
+            return EmailContent.model_construct(subject="", body="")
 
-        async with self._semaphore:
-            # Add delay for rate limiting
-            await asyncio.sleep(self.request_delay)
-
-            try:
-                # Get templates for the category
-                templates = self.email_templates[category.value]
-
-                # Select random subject template and generate email
-                subject_template = random.choice(templates["subject_templates"])
-                subject = subject_template.format(
-                    speaker_name=speaker.name,
-                    company_name=speaker.company,
-                    speaker_title=speaker.title
-                )
+        try:
+            # Get templates for the category
+            templates = self.email_templates[category.value]
 
-                body = templates["body_template"].format(
-                    speaker_name=speaker.name,
-                    company_name=speaker.company,
-                    speaker_title=speaker.title
-                )
+            # Select random subject template and generate email
+            subject_template = self._rng.choice(templates["subject_compiled"])
+            subject = subject_template(
+                speaker_name=speaker.name,
+                company_name=speaker.company,
+                speaker_title=speaker.title
+            )
+
+            body = templates["body_compiled"](
+                speaker_name=speaker.name,
+                company_name=speaker.company,
+                speaker_title=speaker.title
+            )
+
+            return EmailContent.model_construct(subject=subject, body=body)
+
+        except Exception as e:
+            print(f"Error generating email for {speaker.name}: {str(e)}")
+            return EmailContent.model_construct(subject="", body="")
+
+    async def _process_one(self, speaker: Speaker) -> ProcessedSpeaker:
+        """
+        Classify a single speaker and generate their email as soon as the
+        classification returns, so the two phases overlap across speakers
+        instead of email generation waiting on the slowest classification.
+        """
+        result = await self.classify_speaker(speaker)
+        email = self.generate_email(speaker, result.category, result.company_size)
+
+        # Every field already passed through a validated model, so
+        # model_construct skips re-validation per row
+        return ProcessedSpeaker.model_construct(
+            name=speaker.name,
+            title=speaker.title,
+            company=speaker.company,
+            category=result.category,
+            company_size=result.company_size,
+            reasoning=result.reasoning,
+            email_subject=email.subject,
+            email_body=email.body
+        )
+
+    async def _process_one_safe(self, speaker: Speaker) -> ProcessedSpeaker:
+        """Process a speaker, falling back to a default row on failure."""
+        try:
+            return await self._process_one(speaker)
+        except Exception as e:
+            print(f"⚠️ Failed to process {speaker.name}: {e}")
+            # Use default classification for failures
+            return ProcessedSpeaker.model_construct(
+                name=speaker.name,
+                title=speaker.title,
+                company=speaker.company,
+                category=Category.OTHER,
+                company_size=CompanySize.UNKNOWN,
+                reasoning=f"Classification error: {str(e)}",
+                email_subject="",
+                email_body=""
+            )
+
+    async def astream_processed(self, speakers: List[Speaker]) -> AsyncIterator[ProcessedSpeaker]:
+        """
+        Stream ProcessedSpeaker results as they complete.
+
+        Speakers are processed in batches of batch_size and consumed by a
+        fixed pool of max_concurrent worker coroutines, so only O(workers)
+        tasks are ever live (rather than one scheduled coroutine per
+        speaker). Results are yielded in completion order, letting callers
+        overlap downstream work (CSV writes, tallies) with in-flight LLM
+        calls.
+
+        Args:
+            speakers: List of Speaker objects
+
+        Yields:
+            ProcessedSpeaker objects with classification and email data
+        """
+        q_in: asyncio.Queue = asyncio.Queue()
+        q_out: asyncio.Queue = asyncio.Queue()
+
+        async def worker() -> None:
+            while (speaker := await q_in.get()) is not None:
+                q_out.put_nowait(await self._process_one_safe(speaker))
 
-                return EmailContent(subject=subject, body=body)
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(self.max_concurrent)
+        ]
 
-            except Exception as e:
-                print(f"Error generating email for {speaker.name}: {str(e)}")
-                return EmailContent(subject="", body="")
+        try:
+            for start in range(0, len(speakers), self.batch_size):
+                batch = speakers[start:start + self.batch_size]
+                # Resolve this batch's unique companies in packed
+                # structured-output requests first; per-speaker calls only
+                # fire for leftovers
+                await self._prefetch_classifications(batch)
+
+                for speaker in batch:
+                    q_in.put_nowait(speaker)
+                for _ in batch:
+                    yield await q_out.get()
+
+                # Persist newly cached classifications/responses per batch
+                self._save_classification_cache()
+                self.response_cache.flush()
+
+            # Graceful shutdown once every batch has drained
+            for _ in workers:
+                q_in.put_nowait(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            # If the generator is closed early (caller raised mid-stream),
+            # we can't await here — cancel whatever is still running
+            for worker_task in workers:
+                if not worker_task.done():
+                    worker_task.cancel()
 
     async def process_speakers_batch(self, speakers: List[Speaker]) -> List[ProcessedSpeaker]:
         """
@@ -251,96 +645,83 @@ class LLMProcessor:
         Returns:
             List of ProcessedSpeaker objects with classification and email data
         """
-        # Execute classifications with semaphore-based rate limiting
+        # Execute the fused classify+email pipeline in batches with
+        # semaphore-based rate limiting. Batching amortizes per-request
+        # overhead without scheduling every speaker's coroutine at once, and
+        # each speaker's email is generated the instant its classification
+        # returns (emails only go to Builder/Owner + Large companies).
         print(f"Classifying {len(speakers)} speakers (category + company size)...")
-        print(f"⚙️ Settings: {self.max_concurrent} concurrent, {self.request_delay}s delay between requests")
-
-        classification_tasks = [self.classify_speaker(speaker) for speaker in speakers]
-        classification_results = await asyncio.gather(*classification_tasks, return_exceptions=True)
-
-        # Handle any exceptions in results
-        valid_results = []
-        for i, result in enumerate(classification_results):
-            if isinstance(result, Exception):
-                print(f"⚠️ Failed to classify {speakers[i].name}: {result}")
-                # Use default classification for failures
-                valid_results.append(ClassificationResult(
-                    category=Category.OTHER,
-                    company_size=CompanySize.UNKNOWN,
-                    reasoning=f"Classification error: {str(result)}"
-                ))
-            else:
-                valid_results.append(result)
+        print(f"⚙️ Settings: batch size {self.batch_size}, {self.max_concurrent} concurrent, {self.requests_per_minute} requests/minute")
 
-        classification_results = valid_results
-
-        # Generate emails concurrently
-        print(f"Generating emails for qualifying speakers (Builder/Owner + Large companies)...")
-        email_tasks = [
-            self.generate_email(speaker, result.category, result.company_size)
-            for speaker, result in zip(speakers, classification_results)
-        ]
-        email_results = await asyncio.gather(*email_tasks)
-
-        # Build ProcessedSpeaker objects
         processed_speakers = [
-            ProcessedSpeaker(
-                name=speaker.name,
-                title=speaker.title,
-                company=speaker.company,
-                category=result.category,
-                company_size=result.company_size,
-                reasoning=result.reasoning,
-                email_subject=email.subject,
-                email_body=email.body
-            )
-            for speaker, result, email in zip(speakers, classification_results, email_results)
+            speaker async for speaker in self.astream_processed(speakers)
         ]
 
-        # Log category counts
-        counts = Counter(s.category.value for s in processed_speakers)
-        print(f"Category counts: {dict(counts)}")
+        # Log category counts and cache effectiveness; skip the tally pass
+        # entirely when nothing will be shown
+        if self.debug or logging.getLogger().isEnabledFor(logging.INFO):
+            # A list comprehension feeds Counter's C-level update loop
+            counts = Counter([s.category.value for s in processed_speakers])
+            print(f"Category counts: {dict(counts)}")
+            if self.response_cache.hits or self.response_cache.misses:
+                print(f"💾 LLM response cache: {self.response_cache.hits} hits, "
+                      f"{self.response_cache.misses} misses")
 
         return processed_speakers
 
-    async def process_speakers_from_file(self, raw_speakers_file: str) -> List[ProcessedSpeaker]:
+    async def process_speakers(self, speaker_dicts: List[dict], output_file: Optional[str] = None) -> List[ProcessedSpeaker]:
         """
-        Process speakers from raw_speakers.json file.
+        Process in-memory speaker dicts, avoiding any disk round-trip.
 
         Args:
-            raw_speakers_file: Path to raw_speakers.json file
+            speaker_dicts: List of raw speaker dicts (name, title, company)
+            output_file: Optional path to save processed speakers as JSON
 
         Returns:
             List of ProcessedSpeaker objects with classification and email data
         """
-        # Load speakers from JSON file and convert to Speaker objects
-        with open(raw_speakers_file, 'r', encoding='utf-8') as f:
-            speaker_dicts = json.load(f)
-
         speakers = [Speaker(**s) for s in speaker_dicts]
-        print(f"📖 Loaded {len(speakers)} speakers from {raw_speakers_file}")
 
-        # Process the speakers using existing batch method
         processed_speakers = await self.process_speakers_batch(speakers)
 
-        # Save processed data to new file
-        output_file = raw_speakers_file.replace('raw_speakers.json', 'speakers_with_categories.json')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Convert ProcessedSpeaker objects to dicts for JSON serialization
-            output_data = [
-                {
-                    "name": s.name,
-                    "title": s.title,
-                    "company": s.company,
-                    "category": s.category.value,
-                    "company_size": s.company_size.value,
-                    "reasoning": s.reasoning,
-                    "email_subject": s.email_subject,
-                    "email_body": s.email_body
-                }
-                for s in processed_speakers
-            ]
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if output_file:
+            self.save_processed(processed_speakers, output_file)
+
+        return processed_speakers
+
+    def save_processed(self, processed_speakers: List[ProcessedSpeaker], output_file: str) -> None:
+        """Save processed speakers to a JSON file."""
+        # model_dump(mode='json') serializes through pydantic-core's Rust path
+        # and already stringifies the enum fields
+        output_data = [s.model_dump(mode='json') for s in processed_speakers]
+
+        if orjson is not None:
+            Path(output_file).write_bytes(
+                orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
         print(f"💾 Saved processed speakers to {output_file}")
 
-        return processed_speakers
\ No newline at end of file
+    async def process_speakers_from_file(self, raw_speakers_file: str) -> List[ProcessedSpeaker]:
+        """
+        Process speakers from raw_speakers.json file (thin CLI wrapper
+        around process_speakers).
+
+        Args:
+            raw_speakers_file: Path to raw_speakers.json file
+
+        Returns:
+            List of ProcessedSpeaker objects with classification and email data
+        """
+        if orjson is not None:
+            speaker_dicts = orjson.loads(Path(raw_speakers_file).read_bytes())
+        else:
+            with open(raw_speakers_file, 'r', encoding='utf-8') as f:
+                speaker_dicts = json.load(f)
+
+        print(f"📖 Loaded {len(speaker_dicts)} speakers from {raw_speakers_file}")
+
+        output_file = raw_speakers_file.replace('raw_speakers.json', 'speakers_with_categories.json')
+        return await self.process_speakers(speaker_dicts, output_file=output_file)
\ No newline at end of file
@@ -1,8 +1,9 @@
 """
 Pydantic models for type-safe validation of LLM inputs and outputs.
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
+from typing import List
 
 
 class Category(str, Enum):
@@ -23,6 +24,8 @@ class CompanySize(str, Enum):
 
 class Speaker(BaseModel):
     """Input speaker data from scraper."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str
     title: str
     company: str
@@ -30,6 +33,8 @@ class Speaker(BaseModel):
 
 class ClassificationResult(BaseModel):
     """LLM classification response."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     category: Category
     company_size: CompanySize
     reasoning: str = Field(min_length=10)
@@ -42,8 +47,22 @@ class ClassificationResult(BaseModel):
         return v.strip()
 
 
+class IndexedClassification(ClassificationResult):
+    """Classification result tagged with the index of its input speaker."""
+    idx: int = Field(ge=0)
+
+
+class ClassificationBatch(BaseModel):
+    """Structured-output schema for classifying several speakers per request."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    classifications: List[IndexedClassification]
+
+
 class EmailContent(BaseModel):
     """Generated email content."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     subject: str
     body: str
 